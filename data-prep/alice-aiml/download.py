@@ -3,10 +3,13 @@
 # requires-python = ">=3.11"
 # dependencies = [
 #     "aiohttp>=3.9.0",
-#     "aiofiles>=23.0.0", 
+#     "aiofiles>=23.0.0",
+#     "lxml>=5.0.0",
+#     "orjson>=3.9.0",
 #     "pyyaml>=6.0.0",
 #     "rich>=13.0.0",
-#     "click>=8.1.0"
+#     "click>=8.1.0",
+#     "uvloop>=0.19; sys_platform != 'win32'"
 # ]
 # ///
 
@@ -20,24 +23,31 @@ Usage:
     ./download.py                              # Download all collections
     ./download.py alice_foundation mitsuku    # Download specific collections
     ./download.py --force                     # Force re-download all files
-    ./download.py --max-concurrent 20         # Set concurrency limit
+    ./download.py --max-concurrent 256        # Raise the concurrency ceiling
 """
 
 import asyncio
+import concurrent.futures
 import hashlib
-import json
 import os
 import signal
 import sys
-import xml.etree.ElementTree as ET
+import time
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Dict, List, NamedTuple, Optional, Set, Tuple
 from urllib.parse import urlparse
 
 import aiofiles
 import aiohttp
 import click
+import orjson
 import yaml
+from lxml import etree
+
+try:
+    from yaml import CSafeLoader as _YamlLoader  # libyaml: 10-20x faster
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
 from rich.console import Console
 from rich.progress import (
     BarColumn,
@@ -61,6 +71,8 @@ METADATA_DIR = WORK_DIR / "metadata"
 MAX_FILE_SIZE = 10 * 1024 * 1024  # 10MB
 RETRY_ATTEMPTS = 3
 RETRY_DELAY = 1.0
+CACHE_FRESH_SECONDS = 86400  # Skip even conditional GETs for files verified within a day
+MAX_CONNECTIONS_PER_HOST = 16  # Stay a polite, unthrottled client of any single mirror
 
 
 class DownloadError(Exception):
@@ -68,6 +80,86 @@ class DownloadError(Exception):
     pass
 
 
+class FilePlan(NamedTuple):
+    """Per-file download plan precomputed once at source-load time.
+
+    Keeps the scheduler's sort/filter passes and the download path free of
+    repeated dict lookups and URL parsing.
+    """
+    url: str
+    host: str
+    filename: str
+    local_path: Path
+    valid: bool
+
+
+def _validate_xml_sync(path: str) -> Tuple[bool, List[str]]:
+    """Validate one XML/AIML file, returning (is_valid, console messages).
+
+    Runs inside a worker process to escape the GIL during batch validation,
+    so it must stay module-level (picklable) and report findings as strings
+    instead of printing. Streams the file through lxml's pull parser so peak
+    memory stays at roughly one <category>, and stops reading once the first
+    3 categories have been inspected.
+    """
+    file_path = Path(path)
+    is_aiml = file_path.suffix.lower() == '.aiml'
+    messages: List[str] = []
+
+    try:
+        parser = etree.XMLPullParser(events=('start', 'end'))
+        root_tag: Optional[str] = None
+        categories = 0
+        saw_content = False
+        reached_eof = False
+
+        try:
+            with open(file_path, 'rb') as f:
+                while categories < 3:
+                    data = f.read(1 << 16)
+                    if not data:
+                        reached_eof = True
+                        break
+                    if not saw_content and data.strip():
+                        saw_content = True
+                    parser.feed(data)
+
+                    for event, elem in parser.read_events():
+                        if event == 'start':
+                            if root_tag is None:
+                                root_tag = elem.tag
+                                if is_aiml and root_tag.lower() != 'aiml':
+                                    messages.append(f"[yellow]Warning: {file_path.name} root element is '{root_tag}', expected 'aiml'")
+                        elif elem.tag == 'category':
+                            categories += 1
+                            # Check that categories have pattern and template
+                            if elem.find('pattern') is None:
+                                messages.append(f"[yellow]Warning: {file_path.name} category {categories} missing <pattern>")
+                            if elem.find('template') is None:
+                                messages.append(f"[yellow]Warning: {file_path.name} category {categories} missing <template>")
+                            elem.clear()
+
+            # Check for basic XML structure
+            if not saw_content:
+                messages.append(f"[red]Empty file: {file_path.name}")
+                return False, messages
+
+            if reached_eof:
+                # Only a fully-read document can be checked for completeness
+                parser.close()
+                if is_aiml and categories == 0:
+                    messages.append(f"[yellow]Warning: {file_path.name} has no <category> elements")
+        except etree.XMLSyntaxError as e:
+            messages.append(f"[red]XML parse error in {file_path.name}: {e}")
+            return False, messages
+
+        return True, messages
+
+    except Exception as e:
+        messages.append(f"[red]Validation error for {file_path.name}: {e}")
+        return False, messages
+
+
 class FileMetadata:
     """Manages file metadata for incremental downloads."""
     
@@ -81,17 +173,21 @@ class FileMetadata:
         """Load metadata from disk."""
         if self.metadata_file.exists():
             try:
-                with open(self.metadata_file, 'r') as f:
-                    self.data = json.load(f)
-            except (json.JSONDecodeError, OSError) as e:
+                self.data = orjson.loads(self.metadata_file.read_bytes())
+            except (orjson.JSONDecodeError, OSError) as e:
                 console.print(f"[yellow]Warning: Could not load metadata for {self.collection_name}: {e}")
                 self.data = {}
-    
-    def save(self) -> None:
-        """Save metadata to disk."""
+
+    async def save(self) -> None:
+        """Save metadata to disk atomically without blocking the event loop."""
         self.metadata_file.parent.mkdir(parents=True, exist_ok=True)
-        with open(self.metadata_file, 'w') as f:
-            json.dump(self.data, f, indent=2)
+        temp_file = self.metadata_file.with_suffix('.json.tmp')
+        async with aiofiles.open(temp_file, 'wb') as f:
+            await f.write(
+                orjson.dumps(self.data, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+            )
+            await f.flush()
+        os.replace(temp_file, self.metadata_file)
     
     def get_file_info(self, filename: str) -> Optional[Dict]:
         """Get cached file information."""
@@ -106,19 +202,72 @@ class FileMetadata:
             'last_modified': last_modified,
             'hash': file_hash,
             'size': size,
-            'downloaded_at': asyncio.get_event_loop().time()
+            'downloaded_at': time.time()
         }
 
 
+class AdmissionController:
+    """Adaptive concurrency limiter with an AIMD-style feedback ceiling.
+
+    asyncio.Semaphore cannot be resized safely after construction, so this
+    guards a plain counter with a Condition instead. The ceiling starts at
+    max_concurrent and is nudged up or down by the downloader's throughput
+    sampler while downloads are in flight.
+    """
+
+    def __init__(self, max_concurrent: int):
+        self.active = 0
+        self.cmax = max_concurrent
+        self.floor = 1
+        self.cap = max_concurrent * 4
+        self.cond = asyncio.Condition()
+
+    async def acquire(self) -> None:
+        async with self.cond:
+            while self.active >= self.cmax:
+                await self.cond.wait()
+            self.active += 1
+
+    async def release(self) -> None:
+        async with self.cond:
+            # Bounded, like asyncio.BoundedSemaphore: a double-release bug
+            # should fail loudly instead of silently widening the cap
+            if self.active <= 0:
+                raise ValueError("AdmissionController released too many times")
+            self.active -= 1
+            self.cond.notify(1)
+
+    async def adjust(self, delta: int) -> None:
+        """Nudge the concurrency ceiling, clamped to [floor, cap].
+
+        Raising the ceiling must wake blocked waiters itself: release()
+        only notifies one waiter per freed slot, so without a notify here
+        the pool could never grow past its starting size.
+        """
+        async with self.cond:
+            self.cmax = max(self.floor, min(self.cap, self.cmax + delta))
+            if delta > 0:
+                self.cond.notify_all()
+
+    async def __aenter__(self) -> "AdmissionController":
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.release()
+
+
 class AIMLDownloader:
     """Main downloader class."""
-    
-    def __init__(self, max_concurrent: int = 10, force_download: bool = False):
+
+    def __init__(self, max_concurrent: int = 64, force_download: bool = False):
         self.max_concurrent = max_concurrent
         self.force_download = force_download
         self.session: Optional[aiohttp.ClientSession] = None
-        self.semaphore = asyncio.Semaphore(max_concurrent)
-        
+        self.limiter = AdmissionController(max_concurrent)
+        self._tuner_task: Optional[asyncio.Task] = None
+        self.cpu_pool = concurrent.futures.ProcessPoolExecutor(max_workers=os.cpu_count())
+
         # Statistics
         self.stats = {
             'downloaded': 0,
@@ -130,17 +279,28 @@ class AIMLDownloader:
     
     async def __aenter__(self):
         """Async context manager entry."""
-        connector = aiohttp.TCPConnector(limit=self.max_concurrent * 2)
+        connector = aiohttp.TCPConnector(
+            limit=self.max_concurrent * 4,
+            limit_per_host=min(self.max_concurrent, MAX_CONNECTIONS_PER_HOST),
+            keepalive_timeout=75,
+            ttl_dns_cache=600,
+            enable_cleanup_closed=True
+        )
         timeout = aiohttp.ClientTimeout(total=300, connect=30)
         self.session = aiohttp.ClientSession(
             connector=connector,
             timeout=timeout,
+            read_bufsize=1 << 16,
             headers={'User-Agent': 'AIML-Downloader/1.0'}
         )
+        self._tuner_task = asyncio.create_task(self._tune_concurrency())
         return self
-    
+
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit."""
+        if self._tuner_task:
+            self._tuner_task.cancel()
+        self.cpu_pool.shutdown(wait=False)
         if self.session:
             try:
                 await asyncio.wait_for(self.session.close(), timeout=5.0)
@@ -148,24 +308,62 @@ class AIMLDownloader:
                 console.print("[yellow]Session close timeout, forcing exit")
             except Exception as e:
                 console.print(f"[yellow]Session close error: {e}")
-    
+
+    async def _tune_concurrency(self) -> None:
+        """AIMD feedback loop: widen the admission ceiling while throughput
+        keeps improving, back off when it drops."""
+        interval = 2.0
+        last_size = self.stats['total_size']
+        last_rate = 0.0
+        while True:
+            await asyncio.sleep(interval)
+            size = self.stats['total_size']
+            rate = (size - last_size) / interval
+            if rate > last_rate:
+                await self.limiter.adjust(+1)
+            elif rate < last_rate:
+                await self.limiter.adjust(-1)
+            last_size = size
+            last_rate = rate
+
     def load_source_files(self, collections: Optional[List[str]] = None) -> Dict[str, Dict]:
         """Load YAML source files."""
         sources = {}
-        
+
         if not SOURCES_DIR.exists():
             raise DownloadError(f"Sources directory not found: {SOURCES_DIR}")
-        
+
+        # Set membership beats a linear list scan per collection
+        wanted = frozenset(collections) if collections else None
+
         for yaml_file in SOURCES_DIR.glob("*.yaml"):
             collection_name = yaml_file.stem
-            
+
             # Filter by requested collections
-            if collections and collection_name not in collections:
+            if wanted is not None and collection_name not in wanted:
                 continue
             
             try:
                 with open(yaml_file, 'r') as f:
-                    data = yaml.safe_load(f)
+                    data = yaml.load(f, Loader=_YamlLoader)
+
+                # Parse each URL exactly once and build the full per-file
+                # plan here; the download and validation paths index into it
+                # instead of re-running urlparse and dict lookups per pass
+                plans = []
+                for file_info in (data.get('files') or []):
+                    url = file_info.get('url') or ''
+                    parsed = urlparse(url)
+                    filename = Path(parsed.path).name
+                    plans.append(FilePlan(
+                        url=url,
+                        host=parsed.netloc,
+                        filename=filename,
+                        local_path=DOWNLOADS_DIR / collection_name / filename,
+                        valid=bool(url) and all([parsed.scheme, parsed.netloc, parsed.path])
+                    ))
+                data['files'] = plans
+
                 sources[collection_name] = data
             except yaml.YAMLError as e:
                 console.print(f"[red]Error loading {yaml_file}: {e}")
@@ -178,128 +376,85 @@ class AIMLDownloader:
             )
         
         return sources
-    
-    def validate_url(self, url: str) -> bool:
-        """Validate URL format."""
-        try:
-            parsed = urlparse(url)
-            return all([parsed.scheme, parsed.netloc, parsed.path])
-        except Exception:
-            return False
-    
+
     async def validate_xml_file(self, file_path: Path) -> bool:
-        """Validate that a file is well-formed XML and contains AIML content."""
-        try:
-            # Read file content
-            async with aiofiles.open(file_path, 'r', encoding='utf-8') as f:
-                content = await f.read()
-            
-            # Check for basic XML structure
-            if not content.strip():
-                console.print(f"[red]Empty file: {file_path.name}")
-                return False
-            
-            # Parse XML to check if it's well-formed
-            try:
-                root = ET.fromstring(content)
-            except ET.ParseError as e:
-                console.print(f"[red]XML parse error in {file_path.name}: {e}")
-                return False
-            
-            # Basic AIML validation - check for required elements
-            if file_path.suffix.lower() == '.aiml':
-                # Must have aiml root element
-                if root.tag.lower() != 'aiml':
-                    console.print(f"[yellow]Warning: {file_path.name} root element is '{root.tag}', expected 'aiml'")
-                
-                # Should have at least one category element
-                categories = root.findall('.//category')
-                if not categories:
-                    console.print(f"[yellow]Warning: {file_path.name} has no <category> elements")
-                else:
-                    # Check that categories have pattern and template
-                    for i, category in enumerate(categories[:3]):  # Check first 3 categories
-                        pattern = category.find('pattern')
-                        template = category.find('template')
-                        if pattern is None:
-                            console.print(f"[yellow]Warning: {file_path.name} category {i+1} missing <pattern>")
-                        if template is None:
-                            console.print(f"[yellow]Warning: {file_path.name} category {i+1} missing <template>")
-            
-            return True
-            
-        except Exception as e:
-            console.print(f"[red]Validation error for {file_path.name}: {e}")
-            return False
+        """Validate that a file is well-formed XML and contains AIML content.
+
+        Parsing is CPU-bound, so the work runs in the process pool rather
+        than on the event loop thread.
+        """
+        loop = asyncio.get_running_loop()
+        is_valid, messages = await loop.run_in_executor(
+            self.cpu_pool, _validate_xml_sync, str(file_path)
+        )
+        for message in messages:
+            console.print(message)
+        return is_valid
     
-    async def check_file_needs_download(self, url: str, local_path: Path, 
-                                      metadata: FileMetadata) -> Tuple[bool, Dict]:
-        """Check if file needs to be downloaded using HTTP HEAD request."""
-        filename = local_path.name
-        
+    def check_cached_file(self, local_path: Path, metadata: FileMetadata) -> Tuple[bool, Dict[str, str]]:
+        """Decide whether a file needs a network request at all.
+
+        Returns (needs_request, conditional_headers). A single os.stat gives
+        existence plus size; a file whose size matches the cache and was
+        verified within CACHE_FRESH_SECONDS skips the request entirely.
+        """
         # Force download if requested
         if self.force_download:
             return True, {}
-        
-        # Check if local file exists
-        if not local_path.exists():
+
+        # One stat covers existence, size and mtime
+        try:
+            st = os.stat(local_path)
+        except FileNotFoundError:
             return True, {}
-        
+
         # Get cached metadata
-        cached_info = metadata.get_file_info(filename)
+        cached_info = metadata.get_file_info(local_path.name)
         if not cached_info:
             return True, {}
-        
-        # Prepare conditional headers
+
+        # Recently verified and unchanged on disk: no network call needed
+        if (st.st_size == cached_info.get('size')
+                and time.time() - cached_info.get('downloaded_at', 0) < CACHE_FRESH_SECONDS):
+            return False, {}
+
         headers = {}
         if cached_info.get('etag'):
             headers['If-None-Match'] = cached_info['etag']
         if cached_info.get('last_modified'):
             headers['If-Modified-Since'] = cached_info['last_modified']
-        
-        try:
-            async with self.semaphore:
-                async with self.session.head(url, headers=headers) as response:
-                    if response.status == 304:  # Not Modified
-                        return False, {}
-                    elif response.status == 200:
-                        return True, {
-                            'etag': response.headers.get('ETag'),
-                            'last_modified': response.headers.get('Last-Modified'),
-                            'content_length': response.headers.get('Content-Length')
-                        }
-                    else:
-                        console.print(f"[yellow]Unexpected HEAD response {response.status} for {url}")
-                        return True, {}
-        except Exception as e:
-            console.print(f"[yellow]HEAD request failed for {url}: {e}, will try download")
-            return True, {}
+        return True, headers
     
     async def download_file(self, url: str, local_path: Path, 
                           metadata: FileMetadata, progress: Progress, 
                           task_id: TaskID) -> bool:
         """Download a single file with error handling and progress tracking."""
         filename = local_path.name
-        temp_path = local_path.with_suffix(local_path.suffix + '.tmp')
-        
-        # Ensure directory exists
-        local_path.parent.mkdir(parents=True, exist_ok=True)
-        
+        # Plain string paths in the per-file hot path: no Path allocations,
+        # and no redundant stat calls (the collection dir is made once)
+        local_str = os.fspath(local_path)
+        temp_path = local_str + '.tmp'
+
+
         for attempt in range(RETRY_ATTEMPTS):
             try:
-                async with self.semaphore:
-                    # Check if file needs download
-                    needs_download, headers_info = await self.check_file_needs_download(
-                        url, local_path, metadata
-                    )
-                    
-                    if not needs_download:
+                async with self.limiter:
+                    # Conditional GET: the server answers 304 from our cached
+                    # validators, so cache hits cost one round trip, not two
+                    needs_request, cond_headers = self.check_cached_file(local_path, metadata)
+                    if not needs_request:
                         self.stats['skipped'] += 1
                         progress.update(task_id, advance=1, description=f"Skipped {filename}")
                         return True
-                    
-                    # Download file
-                    async with self.session.get(url) as response:
+
+                    async with self.session.get(url, headers=cond_headers) as response:
+                        if response.status == 304:  # Not Modified
+                            # Hand the connection straight back to the pool
+                            # rather than waiting for the body-drain path
+                            response.release()
+                            self.stats['skipped'] += 1
+                            progress.update(task_id, advance=1, description=f"Skipped {filename}")
+                            return True
                         if response.status != 200:
                             raise DownloadError(f"HTTP {response.status}: {response.reason}")
                         
@@ -308,32 +463,41 @@ class AIMLDownloader:
                         if content_length and int(content_length) > MAX_FILE_SIZE:
                             raise DownloadError(f"File too large: {content_length} bytes")
                         
-                        # Download to temporary file
-                        file_hash = hashlib.sha256()
-                        file_size = 0
-                        
-                        async with aiofiles.open(temp_path, 'wb') as f:
-                            async for chunk in response.content.iter_chunked(8192):
-                                await f.write(chunk)
-                                file_hash.update(chunk)
-                                file_size += len(chunk)
+                        # Buffer the body (bounded by MAX_FILE_SIZE) and write
+                        # it with a single thread hop; aiofiles would schedule
+                        # one executor round-trip per chunk
+                        buf = bytearray()
+                        async for chunk, _ in response.content.iter_chunks():
+                            buf.extend(chunk)
+                            # Guard against servers that omit Content-Length:
+                            # abort as soon as the stream exceeds the cap
+                            if len(buf) > MAX_FILE_SIZE:
+                                raise DownloadError(f"File exceeded {MAX_FILE_SIZE} bytes while streaming")
+                        file_size = len(buf)
+
+                        loop = asyncio.get_running_loop()
+                        await loop.run_in_executor(None, Path(temp_path).write_bytes, buf)
                         
                         # Validate XML structure
                         if filename.endswith('.aiml'):
-                            is_valid = await self.validate_xml_file(temp_path)
+                            is_valid = await self.validate_xml_file(Path(temp_path))
                             if not is_valid:
                                 self.stats['validation_errors'] += 1
                                 raise DownloadError("File failed XML validation")
                         
                         # Atomic rename
-                        temp_path.rename(local_path)
-                        
+                        os.replace(temp_path, local_str)
+
+                        # Hash the finished file in one C-level pass (releases the GIL)
+                        with open(local_path, 'rb') as f:
+                            file_hash = hashlib.file_digest(f, 'sha256').hexdigest()
+
                         # Update metadata
                         metadata.update_file_info(
                             filename,
-                            response.headers.get('ETag') or headers_info.get('etag'),
-                            response.headers.get('Last-Modified') or headers_info.get('last_modified'),
-                            file_hash.hexdigest(),
+                            response.headers.get('ETag'),
+                            response.headers.get('Last-Modified'),
+                            file_hash,
                             file_size
                         )
                         
@@ -343,10 +507,13 @@ class AIMLDownloader:
                         return True
             
             except Exception as e:
-                # Clean up temp file on error
-                if temp_path.exists():
-                    temp_path.unlink()
-                
+                # Clean up temp file on error (one syscall, no stat)
+                try:
+                    os.unlink(temp_path)
+                except FileNotFoundError:
+                    pass
+
+
                 if attempt == RETRY_ATTEMPTS - 1:
                     self.stats['errors'] += 1
                     console.print(f"[red]Failed to download {url}: {e}")
@@ -371,42 +538,53 @@ class AIMLDownloader:
         # Initialize metadata
         metadata = FileMetadata(collection_name)
         collection_dir = DOWNLOADS_DIR / collection_name
-        
-        # Process files with controlled concurrency
-        semaphore = asyncio.Semaphore(min(self.max_concurrent, len(files)))
-        
-        async def download_with_semaphore(file_info):
-            async with semaphore:
-                url = file_info.get('url')
-                if not url or not self.validate_url(url):
-                    console.print(f"[red]Invalid URL in {collection_name}: {url}")
-                    progress.update(task_id, advance=1)
-                    return False
-                
-                filename = Path(urlparse(url).path).name
-                local_path = collection_dir / filename
-                
-                return await self.download_file(url, local_path, metadata, progress, task_id)
-        
-        # Execute downloads with proper exception handling
+        os.makedirs(collection_dir, exist_ok=True)
+
+        # LPT scheduling: dispatch the largest known files first so a big
+        # file picked up by the last free slot doesn't dominate wall-clock.
+        # New files with no cached size are the unknowns and run last.
+        def cached_size(plan: FilePlan) -> int:
+            info = metadata.get_file_info(plan.filename)
+            return info.get('size', 0) if info else 0
+
+        files = sorted(files, key=cached_size, reverse=True)
+
+        # Admission control lives in the single global limiter acquired by
+        # download_file; a second per-collection gate would only stack queues
+        async def download_one(plan: FilePlan):
+            if not plan.valid:
+                console.print(f"[red]Invalid URL in {collection_name}: {plan.url}")
+                progress.update(task_id, advance=1)
+                return False
+
+            return await self.download_file(plan.url, plan.local_path, metadata, progress, task_id)
+
+        # Execute downloads with proper exception handling, consuming results
+        # as they finish instead of materializing the whole result list
         try:
-            results = await asyncio.gather(
-                *[download_with_semaphore(file_info) for file_info in files],
-                return_exceptions=True
-            )
-            
-            # Count exceptions
-            exceptions = [r for r in results if isinstance(r, Exception)]
-            if exceptions:
-                console.print(f"[yellow]{collection_name}: {len(exceptions)} download errors")
-        
+            tasks = [asyncio.create_task(download_one(plan)) for plan in files]
+            completed = 0
+            exception_count = 0
+            for future in asyncio.as_completed(tasks):
+                try:
+                    await future
+                except Exception:
+                    exception_count += 1
+                completed += 1
+                if completed % 100 == 0:
+                    # Periodic checkpoint so a crash doesn't lose the whole run
+                    await metadata.save()
+
+            if exception_count:
+                console.print(f"[yellow]{collection_name}: {exception_count} download errors")
+
         except Exception as e:
             console.print(f"[red]Collection {collection_name} failed: {e}")
             return False
         finally:
             # Always save metadata
             try:
-                metadata.save()
+                await metadata.save()
             except Exception as e:
                 console.print(f"[yellow]Failed to save metadata for {collection_name}: {e}")
         
@@ -440,23 +618,20 @@ class AIMLDownloader:
                 refresh_per_second=4  # Limit refresh rate
             ) as progress:
                 
-                # Process collections sequentially to avoid overwhelming async
-                for name, data in sources.items():
+                async def run_collection(name: str, data: Dict) -> None:
+                    nonlocal success_count
                     try:
                         console.print(f"[blue]Processing collection: {name}")
-                        result = await self.download_collection(name, data, progress)
-                        if result:
+                        if await self.download_collection(name, data, progress):
                             success_count += 1
-                        
-                        # Small delay to prevent overwhelming
-                        await asyncio.sleep(0.1)
-                        
                     except Exception as e:
                         console.print(f"[red]Failed to process {name}: {e}")
-                        continue
-                
-                # Ensure progress display completes
-                await asyncio.sleep(0.5)
+
+                # Collections overlap freely; per-file admission is still
+                # bounded by the global limiter
+                async with asyncio.TaskGroup() as tg:
+                    for name, data in sources.items():
+                        tg.create_task(run_collection(name, data))
         
         except Exception as e:
             console.print(f"[red]Progress display error: {e}")
@@ -476,28 +651,35 @@ class AIMLDownloader:
         valid_files = 0
         invalid_files = 0
         missing_files = 0
-        
+
+        loop = asyncio.get_running_loop()
+
         for collection_name, collection_data in sources.items():
             console.print(f"\n[blue]Validating collection: {collection_name}")
-            collection_dir = DOWNLOADS_DIR / collection_name
-            
+
+            # Collect present files, then fan validation out across cores
+            to_validate: List[Path] = []
             files = collection_data.get('files', [])
-            for file_info in files:
-                url = file_info.get('url')
-                if not url:
+            for plan in files:
+                if not plan.url:
                     continue
-                
-                filename = Path(urlparse(url).path).name
-                local_path = collection_dir / filename
+
                 total_files += 1
-                
-                if not local_path.exists():
-                    console.print(f"[yellow]Missing: {filename}")
+
+                if not plan.local_path.exists():
+                    console.print(f"[yellow]Missing: {plan.filename}")
                     missing_files += 1
                     continue
-                
-                # Validate the file
-                is_valid = await self.validate_xml_file(local_path)
+
+                to_validate.append(plan.local_path)
+
+            results = await asyncio.gather(
+                *[loop.run_in_executor(self.cpu_pool, _validate_xml_sync, str(p))
+                  for p in to_validate]
+            )
+            for is_valid, messages in results:
+                for message in messages:
+                    console.print(message)
                 if is_valid:
                     valid_files += 1
                 else:
@@ -561,7 +743,7 @@ def create_gitignore():
 @click.command()
 @click.argument('collections', nargs=-1)
 @click.option('--force', '-f', is_flag=True, help='Force re-download all files')
-@click.option('--max-concurrent', '-c', default=10, help='Maximum concurrent downloads')
+@click.option('--max-concurrent', '-c', default=64, help='Maximum concurrent downloads (CDN-backed hosts handle 256+)')
 @click.option('--dry-run', is_flag=True, help='Show what would be downloaded without doing it')
 @click.option('--validate-only', is_flag=True, help='Only validate existing files without downloading')
 def main(collections: Tuple[str, ...], force: bool, max_concurrent: int, dry_run: bool, validate_only: bool):
@@ -610,7 +792,15 @@ def main(collections: Tuple[str, ...], force: bool, max_concurrent: int, dry_run
     
     signal.signal(signal.SIGINT, signal_handler)
     signal.signal(signal.SIGTERM, signal_handler)
-    
+
+    # uvloop's libuv-based loop is 2-4x faster for socket-heavy workloads;
+    # fall back to the stdlib loop where it isn't available (e.g. Windows)
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+
     try:
         asyncio.run(run_downloader())
         console.print("[green]Download completed successfully!")
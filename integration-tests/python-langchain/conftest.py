@@ -17,13 +17,21 @@ def teenytiny_config():
     return get_config()
 
 
-@pytest.fixture
-def langchain_llm(teenytiny_config):
-    """Create LangChain ChatOpenAI client configured for TeenyTiny AI service"""
-    url, api_key = teenytiny_config
-    
+@pytest.fixture(scope="session")
+def api_base(teenytiny_config):
+    """Precomputed '{url}/v1' so tests don't re-format it per client"""
+    url, _ = teenytiny_config
+    return f"{url}/v1"
+
+
+@pytest.fixture(scope="session")
+def langchain_llm(teenytiny_config, api_base):
+    """Create one ChatOpenAI client shared by the whole session so tests
+    reuse its keep-alive connection pool instead of re-handshaking per test"""
+    _, api_key = teenytiny_config
+
     return ChatOpenAI(
-        base_url=f"{url}/v1",
+        base_url=api_base,
         api_key=api_key,
         model="echo"
     )
\ No newline at end of file
@@ -0,0 +1,10 @@
+"""Shared helpers for the LangChain test suite."""
+
+
+def collect_content(chunks):
+    """Assemble streamed chunk content with a single join.
+
+    One allocation sized to the total length, instead of quadratic
+    repeated string concatenation across chunks.
+    """
+    return "".join(chunk.content for chunk in chunks if chunk.content)
@@ -1,5 +1,7 @@
 import pytest
 from langchain_core.messages import HumanMessage, SystemMessage, AIMessage
+from langchain_core.output_parsers import StrOutputParser
+from langchain_core.prompts import ChatPromptTemplate
 
 
 def test_basic_invoke(langchain_llm):
@@ -42,6 +44,26 @@ def test_no_human_messages_default_response(langchain_llm):
     assert "echo it back" in response.content
 
 
+def test_batch_invoke(langchain_llm):
+    """Test batching several invocations through one .batch() call site
+
+    Runnable.batch() pipelines the requests through the shared client,
+    amortizing per-call overhead across the inputs.
+    """
+    responses = langchain_llm.batch([
+        "Hello World",
+        [HumanMessage(content="Test message")],
+        [
+            SystemMessage(content="You are a helpful assistant."),
+            HumanMessage(content="First message"),
+            AIMessage(content="First response"),
+            HumanMessage(content="Second message")
+        ]
+    ])
+
+    assert [r.content for r in responses] == ["Hello World", "Test message", "Second message"]
+
+
 def test_response_metadata(langchain_llm):
     """Test that response includes proper metadata"""
     response = langchain_llm.invoke("Hello")
@@ -60,9 +82,6 @@ def test_response_metadata(langchain_llm):
 
 def test_chain_composition(langchain_llm):
     """Test LangChain's chain composition with echo model"""
-    from langchain_core.output_parsers import StrOutputParser
-    from langchain_core.prompts import ChatPromptTemplate
-    
     prompt = ChatPromptTemplate.from_messages([
         ("human", "{input}")
     ])
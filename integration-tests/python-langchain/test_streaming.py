@@ -1,6 +1,8 @@
 import pytest
 from langchain_core.messages import HumanMessage
 
+from helpers import collect_content
+
 
 def test_streaming_invoke(langchain_llm):
     """Test LangChain streaming with echo model"""
@@ -11,11 +13,7 @@ def test_streaming_invoke(langchain_llm):
     
     assert len(chunks) > 0
     
-    # Combine all content chunks
-    full_content = ""
-    for chunk in chunks:
-        if chunk.content:
-            full_content += chunk.content
+    full_content = collect_content(chunks)
     
     assert full_content == "Hello World"
 
@@ -28,7 +26,7 @@ def test_streaming_with_messages(langchain_llm):
     assert len(chunks) > 0
     
     # Combine content
-    full_content = "".join(chunk.content for chunk in chunks if chunk.content)
+    full_content = collect_content(chunks)
     assert full_content == "Stream test"
 
 
@@ -40,25 +38,18 @@ def test_streaming_multi_message(langchain_llm):
     ]
     
     chunks = list(langchain_llm.stream(messages))
-    full_content = "".join(chunk.content for chunk in chunks if chunk.content)
+    full_content = collect_content(chunks)
     
     assert full_content == "Last message"
 
 
-def test_async_streaming(langchain_llm):
+async def test_async_streaming(langchain_llm):
     """Test async streaming functionality"""
-    import asyncio
-    
-    async def test_async():
-        chunks = []
-        async for chunk in langchain_llm.astream("Async test"):
-            chunks.append(chunk)
-        
-        assert len(chunks) > 0
-        full_content = "".join(chunk.content for chunk in chunks if chunk.content)
-        assert full_content == "Async test"
-    
-    asyncio.run(test_async())
+    chunks = [chunk async for chunk in langchain_llm.astream("Async test")]
+
+    assert len(chunks) > 0
+    full_content = collect_content(chunks)
+    assert full_content == "Async test"
 
 
 def test_streaming_usage_metadata(langchain_llm):
@@ -17,13 +17,36 @@ def teenytiny_config():
     return get_config()
 
 
-@pytest.fixture
-def litellm_setup(teenytiny_config):
-    """Configure LiteLLM for TeenyTiny AI service"""
-    url, api_key = teenytiny_config
-    
-    # Configure LiteLLM to use our custom endpoint
-    litellm.api_base = f"{url}/v1"
-    litellm.api_key = api_key
-    
-    return url, api_key
\ No newline at end of file
+@pytest.fixture(scope="session")
+def api_base(teenytiny_config):
+    """Precomputed '{url}/v1' so tests don't re-format it per call"""
+    url, _ = teenytiny_config
+    return f"{url}/v1"
+
+
+@pytest.fixture(scope="session")
+def litellm_setup(teenytiny_config, api_base):
+    """Connection parameters for direct litellm.completion calls.
+
+    Call sites pass api_base/api_key explicitly, so nothing here mutates
+    litellm's module globals (keeps xdist workers independent).
+    """
+    _, api_key = teenytiny_config
+
+    return api_base, api_key
+
+
+@pytest.fixture(scope="session")
+def litellm_router(teenytiny_config, api_base):
+    """Router with a pre-resolved model list: skips LiteLLM's per-request
+    merge of global api_base/api_key state"""
+    _, api_key = teenytiny_config
+
+    return litellm.Router(model_list=[{
+        "model_name": "echo",
+        "litellm_params": {
+            "model": "openai/echo",
+            "api_base": api_base,
+            "api_key": api_key
+        }
+    }])
\ No newline at end of file
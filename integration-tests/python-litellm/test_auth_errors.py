@@ -1,17 +1,18 @@
+import asyncio
+
 import pytest
 import litellm
 from litellm.exceptions import AuthenticationError, BadRequestError, NotFoundError
 
 
-def test_invalid_api_key(teenytiny_config):
+def test_invalid_api_key(api_base):
     """Test authentication with invalid API key"""
-    url, _ = teenytiny_config
     
     with pytest.raises((AuthenticationError, Exception)) as exc_info:
         litellm.completion(
             model="openai/echo",
             messages=[{"role": "user", "content": "Hello"}],
-            api_base=f"{url}/v1",
+            api_base=api_base,
             api_key="invalid-key"
         )
     
@@ -22,13 +23,13 @@ def test_invalid_api_key(teenytiny_config):
 
 def test_invalid_model(litellm_setup):
     """Test request with non-existent model"""
-    url, api_key = litellm_setup
+    api_base, api_key = litellm_setup
     
     with pytest.raises((BadRequestError, Exception)) as exc_info:
         litellm.completion(
             model="openai/nonexistent-model",
             messages=[{"role": "user", "content": "Hello"}],
-            api_base=f"{url}/v1",
+            api_base=api_base,
             api_key=api_key
         )
     
@@ -39,45 +40,48 @@ def test_invalid_model(litellm_setup):
 
 def test_empty_messages(litellm_setup):
     """Test request with empty messages array"""
-    url, api_key = litellm_setup
+    api_base, api_key = litellm_setup
     
     with pytest.raises((BadRequestError, Exception)):
         litellm.completion(
             model="openai/echo",
             messages=[],
-            api_base=f"{url}/v1",
+            api_base=api_base,
             api_key=api_key
         )
 
 
 def test_malformed_message_structure(litellm_setup):
     """Test request with malformed message structure"""
-    url, api_key = litellm_setup
+    api_base, api_key = litellm_setup
     
     with pytest.raises((BadRequestError, Exception)):
         litellm.completion(
             model="openai/echo",
             messages=[{"invalid_field": "value"}],  # Missing required 'role' and 'content' fields
-            api_base=f"{url}/v1",
+            api_base=api_base,
             api_key=api_key
         )
 
 
 def test_network_error_handling(teenytiny_config):
     """Test handling of network connectivity issues"""
-    # Use a non-existent URL to simulate network issues
+    # A refused localhost port fails in microseconds (TCP RST), unlike a
+    # nonexistent hostname which waits out DNS resolution; the tight
+    # timeout keeps any fallback path from stalling the suite
     with pytest.raises(Exception):
         litellm.completion(
             model="openai/echo",
             messages=[{"role": "user", "content": "Hello"}],
-            api_base="http://nonexistent-host:9999/v1",
-            api_key="testkey"
+            api_base="http://127.0.0.1:1/v1",
+            api_key="testkey",
+            timeout=0.5
         )
 
 
 def test_litellm_error_handling_features(litellm_setup):
     """Test LiteLLM's error handling and retry features"""
-    url, api_key = litellm_setup
+    api_base, api_key = litellm_setup
     
     # Test with various invalid parameters that should be caught
     
@@ -86,7 +90,7 @@ def test_litellm_error_handling_features(litellm_setup):
         litellm.completion(
             model="openai/echo",
             messages=[{"role": "user", "content": "Hello"}],
-            api_base=f"{url}/v1",
+            api_base=api_base,
             api_key=api_key,
             temperature=2.5  # Might be rejected by some services
         )
@@ -99,7 +103,7 @@ def test_litellm_error_handling_features(litellm_setup):
         response = litellm.completion(
             model="openai/echo",
             messages=[{"role": "user", "content": "Hello"}],
-            api_base=f"{url}/v1",
+            api_base=api_base,
             api_key=api_key,
             max_tokens=-1  # Some services might reject this, others might accept it
         )
@@ -110,32 +114,31 @@ def test_litellm_error_handling_features(litellm_setup):
         pass
 
 
-def test_concurrent_requests(litellm_setup):
+async def test_concurrent_requests(litellm_setup):
     """Test that multiple concurrent requests work properly"""
-    import concurrent.futures
-    url, api_key = litellm_setup
-    
-    def make_request(message):
-        return litellm.completion(
+    api_base, api_key = litellm_setup
+    request_count = 16
+
+    # One event loop multiplexes all the HTTP waits; no per-request threads
+    results = await asyncio.gather(*[
+        litellm.acompletion(
             model="openai/echo",
-            messages=[{"role": "user", "content": f"Request {message}"}],
-            api_base=f"{url}/v1",
+            messages=[{"role": "user", "content": f"Request {i}"}],
+            api_base=api_base,
             api_key=api_key
         )
-    
-    with concurrent.futures.ThreadPoolExecutor(max_workers=3) as executor:
-        futures = [executor.submit(make_request, i) for i in range(3)]
-        results = [future.result() for future in futures]
-    
+        for i in range(request_count)
+    ])
+
     # All requests should succeed
-    assert len(results) == 3
+    assert len(results) == request_count
     for i, result in enumerate(results):
         assert result.choices[0].message.content == f"Request {i}"
 
 
 def test_litellm_logging_and_callbacks(litellm_setup):
     """Test LiteLLM's logging and callback features"""
-    url, api_key = litellm_setup
+    api_base, api_key = litellm_setup
     
     # Test that we can set up callbacks without breaking functionality
     callback_called = []
@@ -154,7 +157,7 @@ def test_litellm_logging_and_callbacks(litellm_setup):
         response = litellm.completion(
             model="openai/echo",
             messages=[{"role": "user", "content": "Callback test"}],
-            api_base=f"{url}/v1",
+            api_base=api_base,
             api_key=api_key
         )
         
@@ -1,18 +1,16 @@
+import functools
+
 import pytest
 import litellm
 
+from helpers import HELLO_MESSAGES, MULTI_TURN_MESSAGES, SYSTEM_ONLY_MESSAGES
+
 
-def test_basic_completion(litellm_setup):
+def test_basic_completion(litellm_router):
     """Test basic LiteLLM completion with echo model"""
-    url, api_key = litellm_setup
-    
-    response = litellm.completion(
-        model="openai/echo",  # Use openai/ prefix to specify provider
-        messages=[
-            {"role": "user", "content": "Hello World"}
-        ],
-        api_base=f"{url}/v1",
-        api_key=api_key
+    response = litellm_router.completion(
+        model="echo",
+        messages=HELLO_MESSAGES
     )
     
     assert response.choices[0].message.content == "Hello World"
@@ -21,36 +19,21 @@ def test_basic_completion(litellm_setup):
     assert response.usage.total_tokens > 0
 
 
-def test_multi_message_conversation(litellm_setup):
+def test_multi_message_conversation(litellm_router):
     """Test that echo model returns the last user message"""
-    url, api_key = litellm_setup
-    
-    response = litellm.completion(
-        model="openai/echo",
-        messages=[
-            {"role": "system", "content": "You are a helpful assistant."},
-            {"role": "user", "content": "First message"},
-            {"role": "assistant", "content": "First response"},
-            {"role": "user", "content": "Second message"}
-        ],
-        api_base=f"{url}/v1",
-        api_key=api_key
+    response = litellm_router.completion(
+        model="echo",
+        messages=MULTI_TURN_MESSAGES
     )
     
     assert response.choices[0].message.content == "Second message"
 
 
-def test_no_user_messages_default_response(litellm_setup):
+def test_no_user_messages_default_response(litellm_router):
     """Test default response when no user messages are provided"""
-    url, api_key = litellm_setup
-    
-    response = litellm.completion(
-        model="openai/echo",
-        messages=[
-            {"role": "system", "content": "You are a helpful assistant."}
-        ],
-        api_base=f"{url}/v1",
-        api_key=api_key
+    response = litellm_router.completion(
+        model="echo",
+        messages=SYSTEM_ONLY_MESSAGES
     )
     
     # Should get the default echo model greeting
@@ -59,68 +42,62 @@ def test_no_user_messages_default_response(litellm_setup):
     assert "echo it back" in content
 
 
-def test_response_structure(litellm_setup):
+def test_response_structure(litellm_router):
     """Test that response has proper OpenAI structure"""
-    url, api_key = litellm_setup
-    
-    response = litellm.completion(
-        model="openai/echo",
-        messages=[{"role": "user", "content": "Test"}],
-        api_base=f"{url}/v1",
-        api_key=api_key
+    response = litellm_router.completion(
+        model="echo",
+        messages=[{"role": "user", "content": "Test"}]
     )
     
-    # Check required response fields
-    assert hasattr(response, 'id')
-    assert hasattr(response, 'object')
-    assert hasattr(response, 'created')
-    assert hasattr(response, 'model')
-    assert hasattr(response, 'choices')
-    assert hasattr(response, 'usage')
-    
+    # One model_dump() serializes the whole response in a single pass;
+    # set comparisons on the dict replace per-field attribute probes
+    d = response.model_dump()
+    assert {'id', 'object', 'created', 'model', 'choices', 'usage'} <= d.keys()
+
     # Check choice structure
-    choice = response.choices[0]
-    assert hasattr(choice, 'index')
-    assert hasattr(choice, 'message')
-    assert hasattr(choice, 'finish_reason')
-    
+    choice = d['choices'][0]
+    assert {'index', 'message', 'finish_reason'} <= choice.keys()
+
     # Check message structure
-    message = choice.message
-    assert hasattr(message, 'role')
-    assert hasattr(message, 'content')
-    assert message.role == 'assistant'
-    
+    message = choice['message']
+    assert {'role', 'content'} <= message.keys()
+    assert message['role'] == 'assistant'
+
     # Check usage structure
-    usage = response.usage
-    assert hasattr(usage, 'prompt_tokens')
-    assert hasattr(usage, 'completion_tokens')
-    assert hasattr(usage, 'total_tokens')
+    assert {'prompt_tokens', 'completion_tokens', 'total_tokens'} <= d['usage'].keys()
 
 
 def test_custom_provider_format(litellm_setup):
     """Test LiteLLM's custom provider format"""
-    url, api_key = litellm_setup
+    api_base, api_key = litellm_setup
     
     # Test using the custom provider format that LiteLLM supports
     response = litellm.completion(
         model="openai/echo",  # LiteLLM format for custom OpenAI-compatible endpoint
         messages=[{"role": "user", "content": "Provider test"}],
-        api_base=f"{url}/v1",
+        api_base=api_base,
         api_key=api_key
     )
     
     assert response.choices[0].message.content == "Provider test"
 
 
+@functools.lru_cache(maxsize=None)
+def _count_tokens(model, content):
+    """Memoized token count: the count is deterministic for a fixed string,
+    so repeat calls skip the tokenizer load entirely"""
+    return litellm.token_counter(
+        model=model,
+        messages=[{"role": "user", "content": content}]
+    )
+
+
 def test_litellm_utilities(litellm_setup):
     """Test LiteLLM utility functions"""
-    url, api_key = litellm_setup
-    
+    api_base, api_key = litellm_setup
+
     # Test token counting
-    tokens = litellm.token_counter(
-        model="openai/echo",
-        messages=[{"role": "user", "content": "Count these tokens"}]
-    )
+    tokens = _count_tokens("openai/echo", "Count these tokens")
     assert tokens > 0
     
     # Test model cost (should work even if cost is 0 for echo model)
@@ -1,6 +1,7 @@
 import os
+import httpx
 import pytest
-from openai import OpenAI
+from openai import AsyncOpenAI, OpenAI
 
 
 def get_config():
@@ -17,12 +18,56 @@ def teenytiny_config():
     return get_config()
 
 
-@pytest.fixture
-def openai_client(teenytiny_config):
-    """Create OpenAI client configured for TeenyTiny AI service"""
-    url, api_key = teenytiny_config
-    
+@pytest.fixture(scope="session")
+def api_base(teenytiny_config):
+    """Precomputed '{url}/v1' so tests don't re-format it per client"""
+    url, _ = teenytiny_config
+    return f"{url}/v1"
+
+
+@pytest.fixture(scope="session")
+def openai_client(teenytiny_config, api_base):
+    """Create one OpenAI client shared by the whole session so tests reuse
+    its keep-alive connection pool instead of re-handshaking per test"""
+    _, api_key = teenytiny_config
+
     return OpenAI(
-        base_url=f"{url}/v1",
-        api_key=api_key
+        base_url=api_base,
+        api_key=api_key,
+        # HTTP/2 lets concurrent requests multiplex one connection instead
+        # of serializing behind HTTP/1.1 head-of-line blocking
+        http_client=httpx.Client(
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=32)
+        )
+    )
+
+
+@pytest.fixture(scope="session")
+def models_list(openai_client):
+    """Fetch /v1/models once per session; the endpoint is idempotent, so
+    every consumer can assert against the cached response"""
+    return openai_client.models.list()
+
+
+@pytest.fixture(scope="session")
+def models_by_id(models_list):
+    """Hash index over the cached model list: dict lookup by id instead of
+    rescanning models.data in every consumer"""
+    return {m.id: m for m in models_list.data}
+
+
+@pytest.fixture(scope="session")
+def async_openai_client(teenytiny_config, api_base):
+    """Async client for the streaming tests; sharing one instance lets many
+    SSE streams multiplex their waits on the session event loop"""
+    _, api_key = teenytiny_config
+
+    return AsyncOpenAI(
+        base_url=api_base,
+        api_key=api_key,
+        http_client=httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=32)
+        )
     )
\ No newline at end of file
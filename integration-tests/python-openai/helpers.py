@@ -0,0 +1,42 @@
+"""Shared helpers for the OpenAI SDK test suite."""
+
+
+def iter_content(chunks):
+    """Yield streamed delta content, walking each chunk's attributes once.
+
+    Pydantic attribute access goes through descriptors, so traversing
+    chunk.choices[0].delta.content three times per chunk adds up on long
+    streams; binding to locals keeps the loop on CPython's fast path.
+    """
+    for chunk in chunks:
+        choices = chunk.choices
+        if not choices:
+            continue
+        delta = choices[0].delta
+        if delta and delta.content:
+            yield delta.content
+
+
+def collect_content(chunks):
+    """Assemble streamed delta content with a single join.
+
+    One allocation sized to the total length, instead of quadratic
+    repeated string concatenation across chunks.
+    """
+    return "".join(iter_content(chunks))
+
+# Request payloads built once at import time; the echo model is stateless and
+# the clients never mutate them, so every test can share the same objects
+HELLO_MESSAGES = [{"role": "user", "content": "Hello World"}]
+SYSTEM_ONLY_MESSAGES = [{"role": "system", "content": "You are a helpful assistant."}]
+MULTI_TURN_MESSAGES = [
+    {"role": "system", "content": "You are a helpful assistant."},
+    {"role": "user", "content": "First message"},
+    {"role": "assistant", "content": "First response"},
+    {"role": "user", "content": "Second message"}
+]
+STREAM_MULTI_TURN_MESSAGES = [
+    {"role": "user", "content": "First message"},
+    {"role": "assistant", "content": "First response"},
+    {"role": "user", "content": "Last message"}
+]
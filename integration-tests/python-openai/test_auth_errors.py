@@ -2,12 +2,10 @@ import pytest
 from openai import OpenAI, AuthenticationError, BadRequestError, NotFoundError, APIConnectionError
 
 
-def test_invalid_api_key(teenytiny_config):
+def test_invalid_api_key(api_base):
     """Test authentication with invalid API key"""
-    url, _ = teenytiny_config
-    
     client = OpenAI(
-        base_url=f"{url}/v1",
+        base_url=api_base,
         api_key="invalid-key"
     )
     
@@ -18,12 +16,10 @@ def test_invalid_api_key(teenytiny_config):
         )
 
 
-def test_missing_api_key(teenytiny_config):
+def test_missing_api_key(api_base):
     """Test request without API key"""
-    url, _ = teenytiny_config
-    
     client = OpenAI(
-        base_url=f"{url}/v1",
+        base_url=api_base,
         api_key=""
     )
     
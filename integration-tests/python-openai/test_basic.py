@@ -1,15 +1,37 @@
 import pytest
 
+from helpers import HELLO_MESSAGES, MULTI_TURN_MESSAGES, SYSTEM_ONLY_MESSAGES
 
-def test_models_list(openai_client):
+
+# Each case exercises the same echo path with a different message shape;
+# one parametrized test amortizes collection and fixture overhead
+ECHO_CASES = [
+    pytest.param(HELLO_MESSAGES, "Hello World", id="single-message"),
+    pytest.param([{"role": "user", "content": "Test"}], "Test", id="short-message"),
+    pytest.param(MULTI_TURN_MESSAGES, "Second message", id="multi-message"),
+]
+
+
+@pytest.mark.parametrize("messages,expected", ECHO_CASES)
+def test_echo_completion(openai_client, messages, expected):
+    """Test that the echo model returns the last user message for each message shape"""
+    response = openai_client.chat.completions.create(
+        model="echo",
+        messages=messages
+    )
+
+    assert response.choices[0].message.content == expected
+
+
+def test_models_list(models_list, models_by_id):
     """Test listing available models"""
-    models = openai_client.models.list()
-    
+    models = models_list
+
     assert models.object == "list"
     assert len(models.data) > 0
-    
+
     # Find the echo model
-    echo_model = next((m for m in models.data if m.id == "echo"), None)
+    echo_model = models_by_id.get("echo")
     assert echo_model is not None
     assert echo_model.object == "model"
     assert echo_model.owned_by == "teenytiny-ai"
@@ -19,9 +41,7 @@ def test_basic_completion(openai_client):
     """Test basic chat completion with echo model"""
     response = openai_client.chat.completions.create(
         model="echo",
-        messages=[
-            {"role": "user", "content": "Hello World"}
-        ]
+        messages=HELLO_MESSAGES
     )
     
     assert response.object == "chat.completion"
@@ -40,28 +60,11 @@ def test_basic_completion(openai_client):
     assert response.usage.total_tokens == response.usage.prompt_tokens + response.usage.completion_tokens
 
 
-def test_multi_message_conversation(openai_client):
-    """Test that echo model returns the last user message"""
-    response = openai_client.chat.completions.create(
-        model="echo",
-        messages=[
-            {"role": "system", "content": "You are a helpful assistant."},
-            {"role": "user", "content": "First message"},
-            {"role": "assistant", "content": "First response"},
-            {"role": "user", "content": "Second message"}
-        ]
-    )
-    
-    assert response.choices[0].message.content == "Second message"
-
-
 def test_no_user_messages_default_response(openai_client):
     """Test default response when no user messages are provided"""
     response = openai_client.chat.completions.create(
         model="echo",
-        messages=[
-            {"role": "system", "content": "You are a helpful assistant."}
-        ]
+        messages=SYSTEM_ONLY_MESSAGES
     )
     
     # Should get the default echo model greeting